@@ -0,0 +1,144 @@
+"""Shared constants for get_accent_word.py and streamlit_app.py"""
+
+import re
+
+import orjson
+
+# Fixed instruction block sent at the start of every prompt. It must stay
+# byte-identical across calls (and across both scripts) so the serving side
+# can reuse its KV cache for the shared prefix; only the text appended after
+# it varies per request.
+SYSTEM_PREFIX = """You are a language assistant. I will provide an English word. Your task is to:
+
+1. Convert the English word into its correct pronunciation in English in USA style (like Toilet: 'TOy Luht').
+2. Convert that pronunciation into a Telugu representation of the sounds.
+
+Respond in JSON format as shown in the example.
+
+Example input: 'toilet'
+Example output:
+{
+  "word": "toilet",
+  "pronunciation": "TOy Luht",
+  "pronunciation_telugu": "టాయ్ లహ్ట్"
+}
+
+Note: Do not include any additional text or explanations, only the JSON object. Do not include any markdown formatting. Ensure the Telugu representation captures the phonetic sounds accurately.
+"""
+
+# Complete prompts, built once. Callers only substitute the word (or the JSON
+# list of words) with %, which leaves the SYSTEM_PREFIX bytes untouched.
+WORD_PROMPT_TMPL = SYSTEM_PREFIX + "Now process the following word: '%s'\n"
+BATCH_PROMPT_TMPL = (
+    SYSTEM_PREFIX + "Now process the following words and return a JSON array in the same order: %s\n"
+)
+
+# Generation limits. A single pronunciation object fits comfortably in this
+# budget even though Telugu script costs several tokens per character; the
+# cap bounds decode time when the model keeps going past the JSON. It is the only
+# bound: no stop sequence is sent because the chat model may open with a preamble
+# such as "Here is the JSON:\n\n", and a separator could end generation before it.
+MAX_TOKENS_PER_WORD = 96
+
+# Rate limits and transient server errors are retried with exponential backoff.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+
+
+def retry_delay(attempt):
+    """Seconds to wait before retry number attempt + 1 (0.3 s, 0.6 s, 1.2 s)."""
+    return 0.3 * 2 ** attempt
+
+
+# Pull the JSON out of the reply even when the model wraps it in a markdown
+# fence or adds prose around it. Pronunciation objects are never nested.
+JSON_OBJECT_RE = re.compile(r"\{[^{}]*\}")
+JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
+def has_complete_json(text, json_re):
+    """
+    True once json_re matches a span of text that parses as JSON.
+
+    A bare regex match isn't enough while streaming: a "]" inside a string value
+    (e.g. a pronunciation written as "[TOY]") makes the array pattern match before
+    the closing bracket of the top-level array has arrived.
+    """
+    match = json_re.search(text)
+    if match is None:
+        return False
+    try:
+        orjson.loads(match.group(0))
+    except orjson.JSONDecodeError:
+        return False
+    return True
+
+
+def normalize_word(word):
+    """Lower-case and collapse whitespace so "Toilet", "toilet " and "TOILET" share one request and cache entry."""
+    return " ".join(word.lower().split())
+
+
+def is_pronunciation_for(word, item):
+    """
+    Check that a parsed reply is a complete pronunciation of word (already normalized).
+
+    Guards every cache write: a reply for a different word, a bare string or an object
+    missing a pronunciation must never be stored under word.
+    """
+    return (
+        isinstance(item, dict)
+        and normalize_word(str(item.get("word", ""))) == word
+        and "pronunciation" in item
+        and "pronunciation_telugu" in item
+    )
+
+
+def match_batch_reply(words, parsed):
+    """
+    Pair a batch reply with the requested words, in order.
+
+    words must already be normalized. Returns one item per word, with None in place
+    of any item that isn't a complete pronunciation of its word (e.g. the model
+    "corrected" the spelling), so only those words need a per-word request. Returns
+    None when the reply isn't a list of len(words) items and can't be paired at all.
+    """
+    if not isinstance(parsed, list) or len(parsed) != len(words):
+        return None
+    return [item if is_pronunciation_for(word, item) else None for word, item in zip(words, parsed)]
+
+
+MAX_WORD_LENGTH = 40
+
+
+def is_valid_word(word):
+    """
+    Cheap pre-filter for input that can't be an English word: non-ASCII text,
+    long pastes, or tokens without a single letter (e.g. numbers).
+
+    Rejected words get an error result without spending an API round trip.
+    """
+    return word.isascii() and 1 <= len(word) <= MAX_WORD_LENGTH and any(c.isalpha() for c in word)
+
+
+def invalid_word_result(word):
+    return {
+        "error": "Invalid input",
+        "details": f"Expected an English word of 1-{MAX_WORD_LENGTH} ASCII characters",
+        "word": word
+    }
+
+
+def parse_sse_line(line):
+    """
+    Return the text delta carried by one server-sent-events line of a streamed chat completion.
+
+    Keep-alives and other non-data lines give "", and the final "data: [DONE]" gives None.
+    """
+    if not line.startswith("data:"):
+        return ""
+    payload = line[len("data:"):].strip()
+    if payload == "[DONE]":
+        return None
+    choices = orjson.loads(payload).get("choices") or [{}]
+    return (choices[0].get("delta") or {}).get("content") or ""
@@ -1,8 +1,28 @@
-import requests
-import json
+import httpx
+import orjson
+from cachetools import LRUCache
+from diskcache import Cache
+import time
 from load_dotenv import load_dotenv
 load_dotenv()
 import os
+from common import (
+    BATCH_PROMPT_TMPL,
+    JSON_ARRAY_RE,
+    JSON_OBJECT_RE,
+    MAX_TOKENS_PER_WORD,
+    WORD_PROMPT_TMPL,
+    MAX_RETRIES,
+    RETRY_STATUSES,
+    has_complete_json,
+    invalid_word_result,
+    is_pronunciation_for,
+    is_valid_word,
+    match_batch_reply,
+    normalize_word,
+    parse_sse_line,
+    retry_delay
+)
 
 
 # --- CONFIGURATION ---
@@ -10,67 +30,174 @@ API_KEY = os.getenv("API_KEY")  # Load from environment variable
 if not API_KEY:
     raise ValueError("API_KEY not found in environment variables. Please set it in the .env file.") 
 MODEL = "meta-llama/Llama-3-70b-chat-hf"
+CACHE_PATH = ".pron_cache"  # On-disk word -> pronunciation cache, shared with streamlit_app.py
 
-# --- FUNCTION TO CALL LLaMA 70B ---
-def get_pronunciation(word):
-    prompt = f"""
-You are a language assistant. I will provide an English word. Your task is to:
-
-1. Convert the English word into its correct pronunciation in English in USA style (like Toilet: 'TOy Luht').
-2. Convert that pronunciation into a Telugu representation of the sounds.
-
-Respond in JSON format as shown in the example.
-
-Example input: 'toilet'
-Example output:
-{{
-  "word": "toilet",
-  "pronunciation": "TOy Luht",
-  "pronunciation_telugu": "టాయ్ లహ్ట్"
-}}
-
-NNote: Do not include any additional text or explanations, only the JSON object. Do not include any markdown formatting. Ensure the Telugu representation captures the phonetic sounds accurately.
-Now process the following word: '{word}'
-"""
-
-    url = "https://api.together.xyz/completions"
-
-    headers = {
+# --- HTTP CLIENT (one HTTP/2 connection multiplexes every request) ---
+CLIENT = httpx.Client(
+    headers={
         "Authorization": f"Bearer {API_KEY}",
         "Content-Type": "application/json"
-    }
-
+    },
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,  # Connection failures only; HTTP status retries are handled below
+        limits=httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    )
+)
+
+# --- PRONUNCIATION CACHE ---
+CACHE = Cache(CACHE_PATH)  # Safe to use while the Streamlit app has it open too
+MEMO = LRUCache(maxsize=2048)  # In-memory layer in front of CACHE; successful results only
+
+def _cache_key(word):
+    return f"{MODEL}|{normalize_word(word)}"
+
+# --- API ---
+URL = "https://api.together.xyz/v1/chat/completions"
+BATCH_SIZE = 16  # Words per completion request, keeps max_tokens within budget
+
+def _stream_completion(prompt, max_tokens, json_re, timeout):
+    """
+    Stream a chat completion and stop reading once the reply holds complete JSON.
+
+    Stopping early only returns the result sooner: httpcore does not reset the
+    HTTP/2 stream, so the server's decode is bounded by max_tokens, not by
+    this loop.
+
+    Returns (status_code, text): the streamed reply on 200, otherwise the error body.
+    """
     data = {
         "model": MODEL,
-        "prompt": prompt,
-        "max_tokens": 200,
-        "temperature": 0
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": max_tokens,
+        "temperature": 0,
+        "stream": True
     }
 
-    response = requests.post(url, headers=headers, json=data)
-    if response.status_code == 200:
-        result = response.json()
-        output_text = result["choices"][0]["text"]
+    for attempt in range(MAX_RETRIES + 1):
+        with CLIENT.stream("POST", URL, content=orjson.dumps(data), timeout=timeout) as response:
+            if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                time.sleep(retry_delay(attempt))
+                continue
+            if response.status_code != 200:
+                response.read()
+                return response.status_code, response.text
+
+            output_text = ""
+            for line in response.iter_lines():
+                delta = parse_sse_line(line)
+                if delta is None:
+                    break
+                output_text += delta
+                if ("}" in delta or "]" in delta) and has_complete_json(output_text, json_re):
+                    break  # Remaining frames are discarded by the client; the connection stays pooled
+        return 200, output_text
 
-        # --- CLEAN OUTPUT ---
-        cleaned_text = output_text.strip().strip("```").strip()
+# --- FUNCTION TO CALL LLaMA 70B ---
+def get_pronunciation(word):
+    prompt = WORD_PROMPT_TMPL % word
+
+    try:
+        status_code, output_text = _stream_completion(prompt, MAX_TOKENS_PER_WORD, JSON_OBJECT_RE, timeout=httpx.Timeout(30.0, connect=5.0))
+    except httpx.TimeoutException:
+        return {"error": "Request timeout"}
+    except httpx.TransportError as e:
+        return {"error": "Connection error", "details": str(e)}
+    except orjson.JSONDecodeError as e:
+        return {"error": "Malformed response stream", "details": str(e)}
+    if status_code == 200:
+        # --- EXTRACT JSON ---
+        match = JSON_OBJECT_RE.search(output_text)
+        if match is None:
+            return {"error": "Failed to parse JSON from LLM output", "raw_output": output_text}
         try:
-            return json.loads(cleaned_text)
-        except json.JSONDecodeError:
+            parsed = orjson.loads(match.group(0))
+        except orjson.JSONDecodeError:
             return {"error": "Failed to parse JSON from LLM output", "raw_output": output_text}
+        if not is_pronunciation_for(normalize_word(word), parsed):
+            return {"error": "LLM reply does not match the requested word", "raw_output": output_text}
+        return parsed
     else:
-        return {"error": f"API request failed with status {response.status_code}", "details": response.text}
+        return {"error": f"API request failed with status {status_code}", "details": output_text}
+
+def _request_batch(words):
+    """
+    Ask for all words in one completion.
+
+    Returns one result per word, None for items that don't match their word, or None
+    if the reply can't be paired with the words at all.
+    """
+    prompt = BATCH_PROMPT_TMPL % orjson.dumps(words).decode()
+
+    try:
+        status_code, output_text = _stream_completion(
+            prompt, MAX_TOKENS_PER_WORD * len(words), JSON_ARRAY_RE, timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+    except httpx.TimeoutException:
+        return [{"error": "Request timeout", "word": w} for w in words]
+    except httpx.TransportError as e:
+        return [{"error": "Connection error", "details": str(e), "word": w} for w in words]
+    except orjson.JSONDecodeError:
+        return None  # Malformed stream frame; retry the words one by one
+    if status_code != 200:
+        error = {"error": f"API request failed with status {status_code}", "details": output_text}
+        return [dict(error, word=w) for w in words]
+
+    match = JSON_ARRAY_RE.search(output_text)
+    if match is None:
+        return None
+    try:
+        parsed = orjson.loads(match.group(0))
+    except orjson.JSONDecodeError:
+        return None
+    return match_batch_reply(words, parsed)
+
+def get_pronunciations_batch(words):
+    """
+    Get pronunciations for many words with one request per BATCH_SIZE cache misses.
+
+    Invalid words are rejected without a request, cached words are served from memory or disk,
+    and any word the chunk's reply doesn't cover falls back to its own get_pronunciation call.
+    """
+    results = {}
+    misses = []
+    for w in words:
+        key = _cache_key(w)
+        if not is_valid_word(w):
+            results[w] = invalid_word_result(w)
+        elif key in MEMO:
+            results[w] = MEMO[key]
+        elif key in CACHE:
+            results[w] = MEMO[key] = CACHE[key]
+        elif w not in results:
+            results[w] = None
+            misses.append(w)
+
+    for i in range(0, len(misses), BATCH_SIZE):
+        chunk = misses[i:i + BATCH_SIZE]
+        outputs = _request_batch(chunk) or [None] * len(chunk)
+        for w, output in zip(chunk, outputs):
+            if output is None:
+                output = get_pronunciation(w)
+            results[w] = output
+            if is_pronunciation_for(w, output):
+                key = _cache_key(w)
+                MEMO[key] = CACHE[key] = output
+
+    return [results[w] for w in words]
 
 # --- PROCESS WORDS AND STORE OUTPUT ---
 words = ["toilet", "computer", "water"]
-all_outputs = []
-
-for w in words:
-    output = get_pronunciation(w)
-    all_outputs.append(output)
+try:
+    all_outputs = get_pronunciations_batch([normalize_word(w) for w in words])
+finally:
+    CACHE.close()
+    CLIENT.close()
 
 # --- SAVE TO JSON FILE ---
-with open("pronunciations.json", "w", encoding="utf-8") as f:
-    json.dump(all_outputs, f, ensure_ascii=False, indent=2)
+# One pre-encoded UTF-8 buffer, written in binary mode with a single write()
+with open("pronunciations.json", "wb") as f:
+    f.write(orjson.dumps(all_outputs, option=orjson.OPT_INDENT_2))
 
 print("Output saved to pronunciations.json")
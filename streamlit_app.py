@@ -1,30 +1,63 @@
 import streamlit as st
-import requests
-import json
+import asyncio
+import atexit
+import httpx
+from cachetools import LRUCache
+from diskcache import Cache
+import functools
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import orjson
+import threading
+import time
 from datetime import datetime
 import os
+import queue
 from pathlib import Path
 from dotenv import load_dotenv
+from common import (
+    BATCH_PROMPT_TMPL,
+    JSON_ARRAY_RE,
+    JSON_OBJECT_RE,
+    MAX_TOKENS_PER_WORD,
+    WORD_PROMPT_TMPL,
+    MAX_RETRIES,
+    RETRY_STATUSES,
+    has_complete_json,
+    invalid_word_result,
+    is_pronunciation_for,
+    is_valid_word,
+    match_batch_reply,
+    normalize_word,
+    parse_sse_line,
+    retry_delay
+)
 load_dotenv()
 
 
 # --- LOGGING CONFIGURATION ---
-# Create logs directory if it doesn't exist
-logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
+@st.cache_resource
+def get_logger():
+    """
+    Configure logging once per server process instead of on every Streamlit rerun
+
+    Records go through a QueueHandler, so the calling thread only enqueues them; a
+    QueueListener thread formats and writes them to the file and console handlers.
+    The listener is kept on the logger so a rebuilt cache entry can shut the old
+    one down instead of leaking its thread and open log file.
 
-# Configure logging with both file and console handlers
-log_filename = logs_dir / f"pronunciation_app_{datetime.now().strftime('%Y%m%d')}.log"
+    Returns:
+        tuple: (logging.Logger, Path) - the configured logger and its log file
+    """
+    # Create logs directory if it doesn't exist
+    logs_dir = Path("logs")
+    logs_dir.mkdir(exist_ok=True)
 
-# Create logger
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+    # Configure logging with both file and console handlers
+    log_filename = logs_dir / f"pronunciation_app_{datetime.now().strftime('%Y%m%d')}.log"
 
-# Prevent duplicate handlers if Streamlit reruns
-if not logger.handlers:
-    # File handler - captures everything
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    # File handler - captures everything, rotated at ~1 MB to cap disk usage
+    file_handler = RotatingFileHandler(log_filename, maxBytes=1_000_000, backupCount=3, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
     file_formatter = logging.Formatter(
         '%(asctime)s | %(levelname)-8s | %(funcName)s:%(lineno)d | %(message)s',
@@ -37,9 +70,29 @@ if not logger.handlers:
     console_handler.setLevel(logging.INFO)
     console_formatter = logging.Formatter('%(levelname)s: %(message)s')
     console_handler.setFormatter(console_formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on shutdown
+
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.DEBUG)
+    logger.handlers.clear()  # Drop the previous cache entry's QueueHandler
+    logger.addHandler(QueueHandler(log_queue))
+
+    # Shut down the previous entry's listener only after new records stop reaching its queue
+    previous_listener = getattr(logger, "_queue_listener", None)
+    logger._queue_listener = listener
+    if previous_listener is not None:
+        atexit.unregister(previous_listener.stop)
+        previous_listener.stop()  # Drains its queue first
+        for handler in previous_listener.handlers:
+            handler.close()
+
+    return logger, log_filename
+
+logger, log_filename = get_logger()
 
 logger.info("="*80)
 logger.info("Application started")
@@ -52,111 +105,386 @@ if not API_KEY:
     st.error("API_KEY not found. Please contact the administrator.")
     st.stop()
 MODEL = "meta-llama/Llama-3-70b-chat-hf"
+CACHE_PATH = ".pron_cache"  # On-disk word -> pronunciation cache, shared with get_accent_word.py
 
-logger.info(f"Configuration loaded - Model: {MODEL}")
+logger.info("Configuration loaded - Model: %s", MODEL)
 
-# --- FUNCTION TO CALL LLaMA 70B ---
-def get_pronunciation(word):
+# Shared by every request made through the httpx AsyncClient
+AUTH_HEADERS = {
+    "Authorization": f"Bearer {API_KEY}",
+    "Content-Type": "application/json"
+}
+
+@st.cache_resource
+def log_request_headers():
+    """Log the request headers (API key redacted) once per server process, not on every rerun"""
+    logger.info("Request headers: %s", {**AUTH_HEADERS, "Authorization": "Bearer ***"})
+
+log_request_headers()
+
+# --- PRONUNCIATION CACHE ---
+@st.cache_resource
+def get_pronunciation_cache():
     """
-    Get pronunciation for a given word using LLaMA API
-    
-    Args:
-        word (str): The English word to get pronunciation for
-        
+    Open the on-disk pronunciation cache once per server process
+
+    diskcache is safe to share across Streamlit's script threads and with
+    get_accent_word.py running in another process at the same time.
+
     Returns:
-        dict: JSON response containing word, pronunciation, and Telugu pronunciation
+        diskcache.Cache: Word -> pronunciation cache
     """
-    logger.info(f"Processing word: '{word}'")
-    
-    prompt = f"""
-You are a language assistant. I will provide an English word. Your task is to:
+    logger.info("Opening pronunciation cache at '%s'", CACHE_PATH)
+    return Cache(CACHE_PATH)
 
-1. Convert the English word into its correct pronunciation in English in USA style (like Toilet: 'TOy Luht').
-2. Convert that pronunciation into a Telugu representation of the sounds.
+@st.cache_resource
+def get_memory_cache():
+    """
+    In-process LRU in front of the disk cache, shared across sessions and reruns
 
-Respond in JSON format as shown in the example.
+    Returns:
+        tuple: (cachetools.LRUCache, threading.Lock)
+    """
+    return LRUCache(maxsize=1024), threading.Lock()
 
-Example input: 'toilet'
-Example output:
-{{
-  "word": "toilet",
-  "pronunciation": "TOy Luht",
-  "pronunciation_telugu": "టాయ్ లహ్ట్"
-}}
+def _cache_key(word):
+    return f"{MODEL}|{normalize_word(word)}"
 
-Note: Do not include any additional text or explanations, only the JSON object. Do not include any markdown formatting. Ensure the Telugu representation captures the phonetic sounds accurately.
-Now process the following word: '{word}'
-"""
+def lookup_cached(word):
+    """
+    Look a word up in the memory cache, then the disk cache
 
-    logger.debug(f"Prompt created for word '{word}' - Length: {len(prompt)} characters")
+    Disk hits are promoted into the memory cache. Keyed by normalize_word so
+    "Toilet" and "toilet " share an entry.
 
-    url = "https://api.together.xyz/completions"
+    Returns:
+        dict or None: Cached result, or None on a miss
+    """
+    memo, memo_lock = get_memory_cache()
+    key = _cache_key(word)
+
+    with memo_lock:
+        cached = memo.get(key)
+    if cached is not None:
+        logger.debug("Memory cache hit for word: '%s'", word)
+        return cached
+
+    cached = get_pronunciation_cache().get(key)
+    if cached is not None:
+        logger.info("Cache hit for word: '%s'", word)
+        with memo_lock:
+            memo[key] = cached
+    return cached
+
+def store_cached(word, result):
+    """
+    Store a successful result in both cache layers; error results are never cached
 
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",  # Masked for logging
-        "Content-Type": "application/json"
-    }
+    Responses are deterministic (temperature 0), so a word only ever needs one API call.
+    Anything that isn't a complete pronunciation of word is rejected, whatever its keys.
+    """
+    if not is_pronunciation_for(normalize_word(word), result):
+        return
+    key = _cache_key(word)
+    memo, memo_lock = get_memory_cache()
+    with memo_lock:
+        memo[key] = result
+    get_pronunciation_cache()[key] = result
+
+def cached(func):
+    """Serve a single-word fetch from the caches and store what it returns"""
+    @functools.wraps(func)
+    async def wrapper(client, word):
+        result = lookup_cached(word)
+        if result is None:
+            result = await func(client, word)
+            store_cached(word, result)
+        return result
+    return wrapper
+
+# --- API ---
+URL = "https://api.together.xyz/v1/chat/completions"
+BATCH_SIZE = 16  # Words per completion request, keeps max_tokens within budget
+
+async def _astream_with_retries(client, data, json_re, read_timeout):
+    """Send the request, retrying RETRY_STATUSES, and stream the reply until json_re holds complete JSON"""
+    for attempt in range(MAX_RETRIES + 1):
+        async with client.stream(
+            "POST", URL, content=orjson.dumps(data), timeout=httpx.Timeout(read_timeout, connect=5.0)
+        ) as response:
+            logger.info("API response received - Status code: %s", response.status_code)
+            if response.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+                logger.warning("Retrying after status %s (attempt %s/%s)", response.status_code, attempt + 1, MAX_RETRIES)
+                await asyncio.sleep(retry_delay(attempt))
+                continue
+            if response.status_code != 200:
+                await response.aread()
+                return response.status_code, response.text
+
+            output_text = ""
+            async for line in response.aiter_lines():
+                delta = parse_sse_line(line)
+                if delta is None:
+                    break
+                output_text += delta
+                if ("}" in delta or "]" in delta) and has_complete_json(output_text, json_re):
+                    # Everything needed has arrived; any later frames are discarded by the client
+                    logger.debug("Complete JSON received, stopping read early")
+                    break
+        return 200, output_text
+
+async def _astream_completion(client, prompt, max_tokens, json_re, timeout):
+    """
+    Stream a chat completion and stop reading once the reply contains a complete JSON value
+
+    Stopping early only returns the result sooner: httpcore does not reset the HTTP/2
+    stream, so the server's decode is bounded by max_tokens.
+
+    httpx timeouts apply to each connect/read/write separately, so a slowly trickling
+    stream could outlive them; asyncio.wait_for caps the request as a whole.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP/2 client carrying the auth headers
+        prompt (str): Full prompt, sent as a single user message
+        max_tokens (int): Generation cap for the request
+        json_re (re.Pattern): Pattern matching the complete JSON value being waited for
+        timeout (int): Total time limit in seconds, retries included
 
+    Returns:
+        tuple: (status_code, text) - the streamed reply on 200, otherwise the error body
+
+    Raises:
+        asyncio.TimeoutError: The request did not finish within timeout seconds
+    """
     data = {
         "model": MODEL,
-        "prompt": prompt,
-        "max_tokens": 200,
-        "temperature": 0
-    }       
+        "messages": [{"role": "user", "content": prompt}],
+        "max_tokens": max_tokens,
+        "temperature": 0,
+        "stream": True
+    }
 
+    logger.debug("API Request parameters - max_tokens: %s, temperature: %s", data['max_tokens'], data['temperature'])
 
+    return await asyncio.wait_for(_astream_with_retries(client, data, json_re, timeout), timeout)
 
-    logger.debug(f"API Request parameters - max_tokens: {data['max_tokens']}, temperature: {data['temperature']}")
+# --- FUNCTION TO CALL LLaMA 70B ---
+@cached
+async def aget_pronunciation(client, word):
+    """
+    Get pronunciation for a given word using LLaMA API
+    
+    Args:
+        client (httpx.AsyncClient): Shared HTTP/2 client carrying the auth headers
+        word (str): The English word to get pronunciation for
+        
+    Returns:
+        dict: JSON response containing word, pronunciation, and Telugu pronunciation
+    """
+    logger.info("Processing word: '%s'", word)
+    
+    prompt = WORD_PROMPT_TMPL % word
+
+    logger.debug("Prompt created for word '%s' - Length: %s characters", word, len(prompt))
 
     try:
-        logger.info(f"Sending API request for word: '{word}'")
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        
-        logger.info(f"API response received - Status code: {response.status_code}")
-        logger.debug(f"Response headers: {dict(response.headers)}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            logger.debug(f"Raw API response: {json.dumps(result, indent=2)}")
-            
-            output_text = result["choices"][0]["text"]
-            logger.debug(f"Extracted output text: {output_text}")
+        logger.info("Sending API request for word: '%s'", word)
+        status_code, output_text = await _astream_completion(
+            client, prompt, MAX_TOKENS_PER_WORD, JSON_OBJECT_RE, timeout=30
+        )
+
+        if status_code == 200:
+            logger.debug("Streamed output text: %s", output_text)
             
-            cleaned_text = output_text.strip().strip("```").strip()
-            logger.debug(f"Cleaned text: {cleaned_text}")
+            match = JSON_OBJECT_RE.search(output_text)
+            if match is None:
+                logger.error("No JSON object in LLM output for word '%s'", word)
+                return {
+                    "error": "Failed to parse JSON from LLM output",
+                    "raw_output": output_text,
+                    "word": word
+                }
+            cleaned_text = match.group(0)
+            logger.debug("Cleaned text: %s", cleaned_text)
             
             try:
-                parsed_json = json.loads(cleaned_text)
-                logger.info(f"Successfully parsed JSON for word '{word}'")
-                logger.debug(f"Parsed result: {json.dumps(parsed_json, ensure_ascii=False)}")
-                return parsed_json
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error for word '{word}': {str(e)}")
-                logger.error(f"Failed to parse text: {cleaned_text}")
+                parsed_json = orjson.loads(cleaned_text)
+            except orjson.JSONDecodeError as e:
+                logger.error("JSON decode error for word '%s': %s", word, e)
+                logger.error("Failed to parse text: %s", cleaned_text)
                 return {
                     "error": "Failed to parse JSON from LLM output",
                     "raw_output": output_text,
                     "word": word
                 }
+
+            if not is_pronunciation_for(normalize_word(word), parsed_json):
+                logger.error("LLM reply for word '%s' is not a pronunciation of it: %s", word, parsed_json)
+                return {
+                    "error": "LLM reply does not match the requested word",
+                    "raw_output": output_text,
+                    "word": word
+                }
+            logger.info("Successfully parsed JSON for word '%s'", word)
+            logger.debug("Parsed result: %s", parsed_json)
+            return parsed_json
         else:
-            logger.error(f"API request failed with status {response.status_code}")
-            logger.error(f"Error details: {response.text}")
+            logger.error("API request failed with status %s", status_code)
+            logger.error("Error details: %s", output_text)
             return {
-                "error": f"API request failed with status {response.status_code}",
-                "details": response.text,
+                "error": f"API request failed with status {status_code}",
+                "details": output_text,
                 "word": word
             }
             
-    except requests.exceptions.Timeout:
-        logger.error(f"API request timeout for word '{word}'")
+    except (httpx.TimeoutException, asyncio.TimeoutError):
+        logger.error("API request timeout for word '%s'", word)
         return {"error": "Request timeout", "word": word}
-    except requests.exceptions.ConnectionError as e:
-        logger.error(f"Connection error for word '{word}': {str(e)}")
+    except httpx.TransportError as e:
+        logger.error("Connection error for word '%s': %s", word, e)
         return {"error": "Connection error", "details": str(e), "word": word}
     except Exception as e:
-        logger.exception(f"Unexpected error processing word '{word}': {str(e)}")
+        logger.exception("Unexpected error processing word '%s': %s", word, e)
         return {"error": "Unexpected error", "details": str(e), "word": word}
 
+async def aget_pronunciations_batch(client, words):
+    """
+    Get pronunciations for several words with a single completion request
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP/2 client carrying the auth headers
+        words (list[str]): Up to BATCH_SIZE words
+
+    Returns:
+        list or None: One result per word in input order, None for each word whose item
+        doesn't match it, or None overall when the reply can't be paired with the words
+        (callers fall back to per-word requests for every None)
+    """
+    logger.info("Processing batch of %s words: %s", len(words), words)
+
+    prompt = BATCH_PROMPT_TMPL % orjson.dumps(words).decode()
+
+    try:
+        status_code, output_text = await _astream_completion(
+            client, prompt, MAX_TOKENS_PER_WORD * len(words), JSON_ARRAY_RE, timeout=60
+        )
+    except (httpx.TimeoutException, asyncio.TimeoutError):
+        logger.error("Batch API request timeout for words %s", words)
+        return [{"error": "Request timeout", "word": w} for w in words]
+    except httpx.TransportError as e:
+        logger.error("Connection error for batch %s: %s", words, e)
+        return [{"error": "Connection error", "details": str(e), "word": w} for w in words]
+
+    if status_code != 200:
+        logger.error("Batch API request failed with status %s", status_code)
+        logger.error("Error details: %s", output_text)
+        return [
+            {"error": f"API request failed with status {status_code}", "details": output_text, "word": w}
+            for w in words
+        ]
+
+    match = JSON_ARRAY_RE.search(output_text)
+    if match is None:
+        logger.warning("No JSON array in LLM output for batch %s", words)
+        return None
+    try:
+        parsed = orjson.loads(match.group(0))
+    except orjson.JSONDecodeError as e:
+        logger.warning("JSON decode error for batch %s: %s", words, e)
+        return None
+
+    outputs = match_batch_reply(words, parsed)
+    if outputs is None:
+        logger.warning("Batch reply does not match the %s requested words", len(words))
+        return None
+
+    mismatched = [w for w, output in zip(words, outputs) if output is None]
+    if mismatched:
+        logger.warning("Batch items do not match their words: %s", mismatched)
+    logger.info("Successfully parsed batch of %s words", len(words))
+    return outputs
+
+async def _fetch_chunk(client, chunk):
+    """Run one batch request, turning unexpected exceptions into a per-word fallback (None)"""
+    try:
+        return chunk, await aget_pronunciations_batch(client, chunk)
+    except Exception as e:
+        logger.exception("Unexpected error processing batch %s: %s", chunk, e)
+        return chunk, None
+
+async def _gather(words, on_progress=None):
+    """
+    Fetch pronunciations for all words, batching cache misses into as few requests as possible
+
+    Invalid input is rejected up front and cached words are served locally. The remaining
+    misses are split into chunks of BATCH_SIZE which are requested concurrently over one
+    HTTP/2 connection. Words whose batch item can't be parsed or doesn't match fall back to
+    one request per word.
+
+    Args:
+        words (list[str]): Unique words to process
+        on_progress (callable, optional): Called as on_progress(done, total) each time a
+            chunk of words finishes, so the UI can update while requests are in flight
+
+    Returns:
+        list: One result dict (or raised exception) per word, in input order
+    """
+    results = {}
+    misses = []
+    for w in words:
+        if not is_valid_word(w):
+            logger.warning("Skipping invalid input: '%s'", w)
+            results[w] = invalid_word_result(w)
+            continue
+        cached_result = lookup_cached(w)
+        if cached_result is not None:
+            results[w] = cached_result
+        else:
+            misses.append(w)
+
+    logger.info("%s words resolved without the API, %s to fetch", len(results), len(misses))
+    if not misses:
+        return [results[w] for w in words]
+
+    def report_progress():
+        if on_progress is not None:
+            on_progress(len(results), len(words))
+
+    report_progress()
+
+    chunks = [misses[i:i + BATCH_SIZE] for i in range(0, len(misses), BATCH_SIZE)]
+    # Created per run: an AsyncClient is bound to the event loop that asyncio.run starts
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,  # Connection failures only
+        limits=httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    )
+    async with httpx.AsyncClient(headers=AUTH_HEADERS, transport=transport) as client:
+        fallback_words = []
+        for next_done in asyncio.as_completed([_fetch_chunk(client, chunk) for chunk in chunks]):
+            chunk, outputs = await next_done
+            if outputs is None:
+                logger.warning("Falling back to per-word requests for %s", chunk)
+                fallback_words.extend(chunk)
+                continue
+            for w, output in zip(chunk, outputs):
+                if output is None:
+                    fallback_words.append(w)
+                    continue
+                store_cached(w, output)
+                results[w] = output
+            report_progress()
+
+        if fallback_words:
+            outputs = await asyncio.gather(
+                *[aget_pronunciation(client, w) for w in fallback_words],
+                return_exceptions=True
+            )
+            results.update(zip(fallback_words, outputs))
+            report_progress()
+
+    return [results[w] for w in words]
+
 # --- STREAMLIT UI ---
 logger.info("Initializing Streamlit UI")
 
@@ -167,14 +495,16 @@ st.write("Enter English words (comma-separated) to get their pronunciation in En
 
 words_input = st.text_area("Words", value="toilet, computer, water")
 
-logger.debug(f"Current input in text area: '{words_input}'")
+logger.debug("Current input in text area: '%s'", words_input)
 
 if st.button("Convert"):
     logger.info("Convert button clicked")
-    logger.info(f"Raw input received: '{words_input}'")
+    logger.info("Raw input received: '%s'", words_input)
     
-    words = [w.strip() for w in words_input.split(",") if w.strip()]
-    logger.info(f"Parsed {len(words)} words: {words}")
+    input_words = [w.strip() for w in words_input.split(",") if w.strip()]
+    # Requests and cache lookups use the normalized form; input_words keeps the casing for display
+    words = [normalize_word(w) for w in input_words]
+    logger.info("Parsed %s words: %s", len(words), words)
     
     if not words:
         logger.warning("No valid words entered by user")
@@ -184,38 +514,46 @@ if st.button("Convert"):
         successful_conversions = 0
         failed_conversions = 0
         
-        logger.info(f"Starting batch processing of {len(words)} words")
-        start_time = datetime.now()
+        # Duplicates ("water, Water") only need one API call; order of first appearance is kept
+        unique_words = list(dict.fromkeys(words))
+        logger.info("Starting batch processing of %s unique words (%s total)", len(unique_words), len(words))
+        start_time = time.monotonic()
         
-        with st.spinner("Processing..."):
-            for idx, w in enumerate(words, 1):
-                logger.info(f"Processing word {idx}/{len(words)}: '{w}'")
-                
-                try:
-                    output = get_pronunciation(w)
-                    all_outputs.append(output)
-                    
-                    if "error" in output:
-                        failed_conversions += 1
-                        logger.warning(f"Failed conversion for word '{w}': {output.get('error')}")
-                    else:
-                        successful_conversions += 1
-                        logger.info(f"Successful conversion for word '{w}'")
-                        
-                except Exception as e:
-                    logger.exception(f"Critical error processing word '{w}': {str(e)}")
-                    all_outputs.append({
-                        "error": "Critical processing error",
-                        "details": str(e),
-                        "word": w
-                    })
-                    failed_conversions += 1
+        progress_bar = st.progress(0.0, text="Processing...")
+
+        def show_progress(done, total):
+            progress_bar.progress(done / total, text=f"Processed {done}/{total} words")
+
+        outputs = asyncio.run(_gather(unique_words, on_progress=show_progress))
+        progress_bar.empty()
+
+        results = {}
+        for w, output in zip(unique_words, outputs):
+            if isinstance(output, BaseException):
+                logger.error("Critical error processing word '%s': %r", w, output)
+                output = {
+                    "error": "Critical processing error",
+                    "details": str(output),
+                    "word": w
+                }
+            results[w] = output
+
+        for idx, (w, input_word) in enumerate(zip(words, input_words), 1):
+            output = {**results[w], "word": input_word}  # Copy: results may be shared cache entries
+            all_outputs.append(output)
+            logger.info("Collected result %s/%s: '%s'", idx, len(words), w)
+
+            if "error" in output:
+                failed_conversions += 1
+                logger.warning("Failed conversion for word '%s': %s", w, output.get('error'))
+            else:
+                successful_conversions += 1
+                logger.info("Successful conversion for word '%s'", w)
         
-        end_time = datetime.now()
-        processing_duration = (end_time - start_time).total_seconds()
+        processing_duration = time.monotonic() - start_time
         
-        logger.info(f"Batch processing completed in {processing_duration:.2f} seconds")
-        logger.info(f"Results - Successful: {successful_conversions}, Failed: {failed_conversions}")
+        logger.info("Batch processing completed in %.2f seconds", processing_duration)
+        logger.info("Results - Successful: %s, Failed: %s", successful_conversions, failed_conversions)
 
         # Display output
         st.subheader("Results")
@@ -232,8 +570,8 @@ if st.button("Convert"):
             st.metric("Failed", failed_conversions)
 
         # Save to JSON file and provide download link
-        json_str = json.dumps(all_outputs, ensure_ascii=False, indent=2)
-        logger.info(f"Generated JSON output - Size: {len(json_str)} bytes")
+        json_str = orjson.dumps(all_outputs, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        logger.info("Generated JSON output - Size: %s bytes", len(json_str))
         
         st.download_button(
             label="Download JSON",
@@ -256,10 +594,13 @@ with st.sidebar:
         # Show recent log entries
         if st.checkbox("Show recent logs"):
             try:
-                with open(log_filename, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    recent_logs = ''.join(lines[-20:])  # Last 20 lines
-                    st.text_area("Recent Log Entries", recent_logs, height=300)
+                # Read only the end of the file; 8 KB comfortably holds the last 20 lines
+                with open(log_filename, 'rb') as f:
+                    f.seek(0, os.SEEK_END)
+                    f.seek(max(0, f.tell() - 8192))
+                    tail = f.read().decode('utf-8', errors='replace')
+                recent_logs = '\n'.join(tail.splitlines()[-20:])  # Last 20 lines
+                st.text_area("Recent Log Entries", recent_logs, height=300)
             except Exception as e:
                 st.error(f"Error reading log file: {e}")
 